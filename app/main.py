@@ -1,12 +1,16 @@
 import io
 import os
+from collections.abc import AsyncIterator, Iterable
+from typing import BinaryIO
 
 from fastapi import FastAPI, Request, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
-from .vcards import contacts_to_vcards40, parse_vcards
+from .models import Contact
+from .vcards import iter_vcards40, parse_vcards
 
 app = FastAPI()
 templates = Jinja2Templates(directory="app/templates")
@@ -22,18 +26,36 @@ async def home(request: Request):
 async def health():
     return {"status": "ok"}
 
+async def _vcf_stream(cards: Iterable[str]) -> AsyncIterator[bytes]:
+    # Async iterator so Starlette sends each card directly instead of
+    # pulling a sync iterator through its threadpool
+    for card in cards:
+        yield card.encode("utf-8")
+
+def _parse_upload(raw: BinaryIO) -> list[Contact]:
+    # Decode the spooled upload line by line instead of holding both the raw
+    # bytes and a decoded copy. Non-UTF-8 bytes are kept as surrogate escapes
+    # for per-property CHARSET decoding.
+    stream = io.TextIOWrapper(raw, encoding="utf-8", errors="surrogateescape", newline="")
+    try:
+        return parse_vcards(stream)
+    finally:
+        # Leave closing the underlying file to FastAPI
+        stream.detach()
+
 @app.post("/upload")
 async def upload(file: UploadFile):
-    data = await file.read()
-    contacts = parse_vcards(data.decode(errors="ignore"))
-    vcf_text = contacts_to_vcards40(contacts)
+    # Reading a large (disk-spooled) upload and parsing it block, so run them
+    # in the threadpool; parsing has to finish here because FastAPI closes
+    # the file before the response body is streamed.
+    contacts = await run_in_threadpool(_parse_upload, file.file)
     # Derive download filename from uploaded file
     base = (file.filename or "contacts").rsplit("/", 1)[-1].rsplit("\\", 1)[-1]
     if base.lower().endswith('.vcf'):
         base = base[:-4]
     out_name = f"{base}-4.0.vcf"
     return StreamingResponse(
-        io.BytesIO(vcf_text.encode("utf-8")),
+        _vcf_stream(iter_vcards40(contacts)),
         media_type="text/vcard; charset=utf-8",
         headers={"Content-Disposition": f"attachment; filename={out_name}"},
     )
\ No newline at end of file
@@ -0,0 +1,34 @@
+from dataclasses import dataclass
+
+
+@dataclass(slots=True, frozen=True)
+class Name:
+    """Structured N value: family;given;additional;prefix;suffix."""
+    family: str = ""
+    given: str = ""
+    additional: str = ""
+    prefix: str = ""
+    suffix: str = ""
+
+
+@dataclass(slots=True, frozen=True)
+class Email:
+    value: str
+    types: tuple[str, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class Phone:
+    value: str
+    types: tuple[str, ...] = ()
+
+
+@dataclass(slots=True, frozen=True)
+class Contact:
+    name: str | None = None  # FN if present
+    n: Name | None = None
+    emails: tuple[Email, ...] = ()
+    phones: tuple[Phone, ...] = ()
+    org: tuple[str, ...] | None = None  # structured components
+    bday: str | None = None  # vCard 4.0 date form where recognizable
+    notes: tuple[str, ...] = ()
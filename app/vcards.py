@@ -1,63 +1,66 @@
+import io
+import os
+import quopri
 import re
-from typing import Optional
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from uuid import uuid4
 
-import vobject
+from .models import Contact, Email, Name, Phone
 
 CRLF = "\r\n"
 
 
+# RFC 6350 section 3.4 text escaping, applied in a single translate pass
+_ESCAPE_TABLE = str.maketrans({"\\": "\\\\", ";": r"\;", ",": r"\,", "\n": r"\n", "\r": ""})
+
 def _escape(s: str) -> str:
     if not s:
         return ""
-    return (str(s)
-            .replace("\\", "\\\\")
-            .replace(";", r"\\;")
-            .replace(",", r"\\,")
-            .replace("\n", r"\\n")
-            .replace("\r", ""))
+    if not isinstance(s, str):
+        s = str(s)
+    # Most values contain nothing to escape; return those without copying
+    if "\\" in s or ";" in s or "," in s or "\n" in s or "\r" in s:
+        return s.translate(_ESCAPE_TABLE)
+    return s
+
+# Whitespace and common punctuation dropped from phone numbers; a leading '+' is kept
+_TEL_DELETE = str.maketrans("", "", " \t\r\n\v\f()-.")
+
+def _normalize_tel_uri(raw) -> str:
+    tel = (raw if isinstance(raw, str) else str(raw or "")).translate(_TEL_DELETE)
+    return tel if tel.startswith("tel:") else "tel:" + tel
 
 _PREFIXES = {"mr", "mrs", "ms", "dr", "prof"}
 _SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "phd", "md"}
 
-def _split_name(fn: str) -> dict[str, str]:
-    """Best-effort split of a display name into structured N fields.
-    Returns dict with keys: family, given, additional, prefix, suffix.
-    """
-    tokens = [t for t in re.split(r"\s+", (fn or "").strip()) if t]
+_EMPTY_NAME = Name()
+
+def _split_name(fn: str) -> Name:
+    """Best-effort split of a display name into structured N fields."""
+    tokens = (fn or "").split()
     if not tokens:
-        return {"family": "", "given": "", "additional": "", "prefix": "", "suffix": ""}
-    # Normalize helper strips trailing dots for prefix/suffix matching
-    def norm(t: str) -> str:
-        return re.sub(r"\.+$", "", t).lower()
-    prefix = tokens[0] if norm(tokens[0]) in _PREFIXES else ""
-    suffix = tokens[-1] if norm(tokens[-1]) in _SUFFIXES else ""
+        return _EMPTY_NAME
+    # Trailing dots are stripped for prefix/suffix matching
+    prefix = tokens[0] if tokens[0].rstrip(".").lower() in _PREFIXES else ""
+    suffix = tokens[-1] if tokens[-1].rstrip(".").lower() in _SUFFIXES else ""
+    if not (prefix or suffix) and len(tokens) <= 2:
+        # Common "Given" / "Given Family" display names
+        return Name(family=tokens[1] if len(tokens) == 2 else "", given=tokens[0])
     core = (
         tokens[1:-1]
         if (prefix and suffix)
         else (tokens[1:] if prefix else (tokens[:-1] if suffix else tokens))
     )
     if not core:
-        return {
-            "family": "",
-            "given": tokens[0] if tokens else "",
-            "additional": "",
-            "prefix": prefix,
-            "suffix": suffix,
-        }
+        return Name(given=tokens[0], prefix=prefix, suffix=suffix)
     if len(core) == 1:
         given, family = core[0], ""
-        additional = ""
     else:
         given, family = core[0], " ".join(core[1:])
-        additional = ""
-    return {
-        "family": family,
-        "given": given,
-        "additional": additional,
-        "prefix": prefix,
-        "suffix": suffix,
-    }
+    return Name(family=family, given=given, prefix=prefix, suffix=suffix)
 
 def _split_types(val) -> list[str]:
     if not val:
@@ -67,181 +70,515 @@ def _split_types(val) -> list[str]:
     elif isinstance(val, list):
         parts = []
         for x in val:
-            parts.extend([p.strip() for p in str(x).split(",") if p.strip()])
+            s = x if isinstance(x, str) else str(x)
+            parts.extend([p.strip() for p in s.split(",") if p.strip()])
     else:
         parts = [str(val).strip()]
     return [p.lower() for p in parts]
 
-def _normalize_types(kind: str, types: list[str]) -> list[str]:
-    # Dedup, lowercase done in _split_types; filter unwanted values
-    tset = set(types or [])
-    if kind == "email":
-        # RFC 6350 removed INTERNET; it's implied, so drop it
-        tset.discard("internet")
-    if kind == "tel" and len(tset) > 1 and "voice" in tset:
+@lru_cache(maxsize=256)
+def _normalize_types_cached(kind: str, types: tuple[str, ...]) -> tuple[str, ...]:
+    # Type lists hold 0-3 items, so a list scan beats building a set
+    out: list[str] = []
+    for t in types:
+        tl = t.lower()
+        if tl in out:
+            continue
+        if kind == "email" and tl == "internet":
+            # RFC 6350 removed INTERNET; it's implied, so drop it
+            continue
+        out.append(tl)
+    if kind == "tel" and len(out) > 1 and "voice" in out:
         # Drop 'voice' if there are other types present
-        tset.remove("voice")
-    return sorted(tset)
+        out.remove("voice")
+    out.sort()
+    return tuple(out)
+
+def _normalize_types(kind: str, types) -> tuple[str, ...]:
+    # Dedup, lowercase and filter unwanted values. Real-world type
+    # vocabularies are tiny, so results are memoized; tuple() is free for
+    # the tuples parse_vcards already stores.
+    return _normalize_types_cached(kind, tuple(types or ()))
+
+@lru_cache(maxsize=256)
+def _type_param_cached(kind: str, types: tuple[str, ...]) -> str:
+    norm = _normalize_types_cached(kind, types)
+    return (";TYPE=" + ",".join(norm)) if norm else ""
+
+def _type_param(kind: str, types) -> str:
+    # Fully formatted ";TYPE=..." parameter, shared across all cards
+    return _type_param_cached(kind, tuple(types or ()))
 
-_KNOWN_TEL_TYPES = {
+_KNOWN_TEL_TYPES = frozenset({
     "home", "work", "cell", "voice", "fax", "pager", "text", "textphone", "main", "iphone"
-}
-_KNOWN_EMAIL_TYPES = {"home", "work", "internet", "pref", "x-mobileme"}
+})
+_KNOWN_EMAIL_TYPES = frozenset({"home", "work", "internet", "pref", "x-mobileme"})
+_KNOWN_TYPES = {"tel": _KNOWN_TEL_TYPES, "email": _KNOWN_EMAIL_TYPES}
 
-def _extract_types_from_params(kind: str, params: dict, singletonparams) -> list[str]:
+def _extract_types_from_params(kind: str, params: dict, singletonparams) -> tuple[str, ...]:
+    if not params and not singletonparams:
+        # Most EMAIL/TEL lines carry no parameters at all
+        return ()
     types: list[str] = []
     p = params or {}
     # TYPE values (comma-joined or list)
     if 'TYPE' in p:
-        types.extend(_split_types(p.get('TYPE')))
-    # vCard 2.1 style: bare flags like HOME/WORK appear as parameter keys
-    for key, _val in p.items():
-        k = str(key).lower()
-        if k == 'type':
+        types.extend(_split_types(p['TYPE']))
+    # KEY=value parameters named after a known type (e.g. HOME=1); keys are
+    # upper-cased by _parse_params
+    known = _KNOWN_TYPES.get(kind, frozenset())
+    for key in p:
+        if key == 'TYPE':
             continue
-        if kind == 'tel' and k in _KNOWN_TEL_TYPES:
-            types.append(k)
-        if kind == 'email' and k in _KNOWN_EMAIL_TYPES:
+        k = key.lower()
+        if k in known:
             types.append(k)
-    # singletonparams fallback (some vobject versions)
+    # Bare 2.1 flags (e.g. TEL;CELL) collected by _parse_params
     if singletonparams:
         types.extend(_split_types(singletonparams))
     return _normalize_types(kind, types)
 
-essential_fields = ("fn", "email_list", "tel_list", "org")
-
-def parse_vcards(text: str) -> list[dict]:
-    """Parse vCard text into a normalized contact dict list.
-
-    Output shape per contact:
-      {
-        name: Optional[str]  # FN if present
-        n: {
-          family: str, given: str, additional: str, prefix: str, suffix: str
-        } | None
-        emails: List[{ value: str, types: List[str] }]
-        phones: List[{ value: str, types: List[str] }]
-        org: List[str] | None  # structured components
-      }
+# Start of a content line: optional group, property name, then params or value
+_PROPERTY_START_RE = re.compile(r"(?:[A-Za-z0-9-]+\.)?[A-Za-z0-9-]+[;:]")
+
+def _unfold(lines: Iterable[str]) -> Iterator[str]:
+    """Join RFC 6350 folded lines (and vCard 2.1 quoted-printable soft breaks).
+
+    A soft break is only followed while the next line cannot start a
+    property, so a stray trailing ``=`` never swallows e.g. END:VCARD.
+    """
+    buf: str | None = None
+    for line in lines:
+        if buf is not None:
+            if line.startswith((" ", "\t")):
+                buf += line[1:]
+                continue
+            if (
+                buf.endswith("=")
+                and "QUOTED-PRINTABLE" in buf.partition(":")[0].upper()
+                and not _PROPERTY_START_RE.match(line)
+            ):
+                buf = buf[:-1] + line
+                continue
+            yield buf
+        buf = line
+    if buf is not None:
+        yield buf
+
+def _split_line(line: str) -> tuple[list[str], str] | None:
+    """Split a content line into ``[name, *params]`` and its value.
+
+    ``:`` and ``;`` inside double-quoted parameter values do not count as
+    separators. Returns ``None`` for lines without a value.
+    """
+    colon = line.find(":")
+    if colon < 0:
+        return None
+    if '"' not in line[:colon]:
+        return line[:colon].split(";"), line[colon + 1:]
+    parts: list[str] = []
+    start = 0
+    quoted = False
+    for i, ch in enumerate(line):
+        if ch == '"':
+            quoted = not quoted
+        elif quoted:
+            continue
+        elif ch == ";":
+            parts.append(line[start:i])
+            start = i + 1
+        elif ch == ":":
+            parts.append(line[start:i])
+            return parts, line[i + 1:]
+    return None
+
+# vCard 2.1 ENCODING values that may appear as bare flags
+_ENCODING_FLAGS = frozenset({"7BIT", "8BIT", "QUOTED-PRINTABLE", "BASE64"})
+
+def _parse_params(raw: list[str]) -> tuple[dict[str, list[str]], list[str]]:
+    """Split ``;``-separated parameters into KEY=values and bare (2.1 style) flags.
+
+    Bare encoding flags (e.g. ``TEL;QUOTED-PRINTABLE``) are filed under
+    ENCODING so they are not mistaken for types.
+    """
+    params: dict[str, list[str]] = {}
+    singleton: list[str] = []
+    for item in raw:
+        key, sep, val = item.partition("=")
+        key = key.strip()
+        if not sep:
+            if key.upper() in _ENCODING_FLAGS:
+                params.setdefault("ENCODING", []).append(key.upper())
+            elif key:
+                singleton.append(key)
+            continue
+        params.setdefault(key.upper(), []).extend(
+            v.strip().strip('"') for v in val.split(",")
+        )
+    return params, singleton
+
+def _decode_charset(raw: bytes, params: dict[str, list[str]]) -> str:
+    charset = (params.get("CHARSET") or ["utf-8"])[0]
+    try:
+        text = raw.decode(charset, errors="replace")
+    except (LookupError, UnicodeError):
+        # Unknown charset, or a codec such as idna that rejects the value
+        return raw.decode("utf-8", errors="replace")
+    # Codecs like utf-7 or unicode_escape can produce lone surrogates
+    return _drop_undecodable(text) if _has_surrogates(text) else text
+
+def _decode_qp(value: str, params: dict[str, list[str]]) -> str:
+    return _decode_charset(quopri.decodestring(value.encode("utf-8", "surrogateescape")), params)
+
+def _has_surrogates(s: str) -> bool:
+    if s.isascii():
+        return False
+    try:
+        s.encode("utf-8")
+    except UnicodeEncodeError:
+        return True
+    return False
+
+def _drop_undecodable(s: str) -> str:
+    """Remove surrogates: non-UTF-8 bytes kept as surrogate escapes, or lone ones."""
+    return s.encode("utf-8", "surrogatepass").decode("utf-8", errors="ignore")
+
+def _decode_8bit(value: str, params: dict[str, list[str]]) -> str:
+    """Re-decode a value whose raw bytes were not UTF-8 (kept as surrogate escapes).
+
+    2.1 exports often carry e.g. CHARSET=ISO-8859-1 with unencoded 8-bit
+    text; without a CHARSET the undecodable bytes are dropped.
     """
-    contacts: list[dict] = []
-    for v in vobject.readComponents(text):
-        # FN and structured N
-        fn_obj = getattr(v, 'fn', None)
-        fn_val: Optional[str] = fn_obj.value if fn_obj is not None else None
-        n_struct = None
-        n_obj = getattr(v, 'n', None)
-        if n_obj is not None:
-            nval = n_obj.value  # vobject.vcard.Name
-            n_struct = {
-                "family": nval.family or "",
-                "given": nval.given or "",
-                "additional": nval.additional or "",
-                "prefix": nval.prefix or "",
-                "suffix": nval.suffix or "",
-            }
+    if "CHARSET" in params:
+        return _decode_charset(value.encode("utf-8", "surrogateescape"), params)
+    return _drop_undecodable(value)
+
+def _unescape(s: str) -> str:
+    if "\\" not in s:
+        return s
+    out: list[str] = []
+    it = iter(s)
+    for ch in it:
+        if ch == "\\":
+            nxt = next(it, "")
+            out.append("\n" if nxt in ("n", "N") else nxt)
+        else:
+            out.append(ch)
+    return "".join(out)
+
+def _split_structured(value: str) -> list[str]:
+    """Split a structured value (N, ORG) on unescaped ``;`` and unescape components."""
+    if "\\" not in value:
+        return value.split(";")
+    parts: list[str] = []
+    cur: list[str] = []
+    it = iter(value)
+    for ch in it:
+        if ch == "\\":
+            nxt = next(it, "")
+            cur.append("\n" if nxt in ("n", "N") else nxt)
+        elif ch == ";":
+            parts.append("".join(cur))
+            cur = []
         else:
-            # Derive a minimal N from FN as best-effort using split helper
-            n_struct = _split_name(str(fn_val)) if fn_val else None
-
-        # Emails with types
-        emails = []
-        for e in getattr(v, 'email_list', []):
-            params = getattr(e, 'params', {}) or {}
-            singleton = getattr(e, 'singletonparams', []) or []
-            types = _extract_types_from_params('email', params, singleton)
-            emails.append({"value": e.value, "types": types})
-
-        # Phones with types
-        phones = []
-        for p in getattr(v, 'tel_list', []):
-            params = getattr(p, 'params', {}) or {}
-            singleton = getattr(p, 'singletonparams', []) or []
-            types = _extract_types_from_params('tel', params, singleton)
-            phones.append({"value": p.value, "types": types})
-
-        # ORG structured components
-        org_list = None
-        org_obj = getattr(v, 'org', None)
-        if org_obj is not None:
-            try:
-                # Typically a list of components
-                vals = org_obj.value or []
-                org_list = [str(x) for x in vals]
-            except Exception:
-                # fallback: treat as a single string
-                try:
-                    org_list = [str(org_obj.value)]
-                except Exception:
-                    org_list = None
-
-        c = {
-            "name": fn_val,
-            "n": n_struct,
-            "emails": emails,
-            "phones": phones,
-            "org": org_list,
-        }
-        contacts.append(c)
-    return contacts
-
-
-def contact_to_vcard40(c: dict) -> str:
-    props = [
-        "BEGIN:VCARD",
-        "VERSION:4.0",
-    ]
+            cur.append(ch)
+    parts.append("".join(cur))
+    return parts
+
+# Handlers fill a per-card dict of Contact fields (lists while scanning);
+# the frozen Contact, with tuple fields, is built from it once the card ends.
+def _h_fn(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    if c["name"] is None:
+        c["name"] = _unescape(value)
+
+def _h_n(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    if c["n"] is None:
+        c["n"] = Name(*_split_structured(value)[:5])
+
+def _h_email(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    types = _extract_types_from_params("email", params, singleton)
+    c["emails"].append(Email(_unescape(value), types))
+
+def _h_tel(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    types = _extract_types_from_params("tel", params, singleton)
+    c["phones"].append(Phone(_unescape(value), types))
+
+def _h_org(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    if c["org"] is None:
+        c["org"] = tuple(_split_structured(value))
+
+# Dates (including reduced precision such as 1985, 1985-04, --0415 and
+# ---15) and date-times in basic or (3.0-style) extended ISO 8601 form;
+# a "-" stands for an omitted year or month
+_DATE_RE = re.compile(r"(\d{4}|-)(?:-?(\d{2})|-)?(?:-?(\d{2}))?")
+_TIME_RE = re.compile(r"(\d{2}):?(\d{2})(?::?(\d{2}))?(?:\.\d+)?(Z|[+-]\d{2}(?::?\d{2})?)?")
+
+def _bday_40(value: str) -> str | None:
+    """Return ``value`` in RFC 6350 basic date/date-time form, or None if it is not one."""
+    date, sep, time = value.partition("T")
+    d = _DATE_RE.fullmatch(date)
+    if d is None:
+        return None
+    year, month, day = d.groups()
+    if year != "-":
+        if day and not month:
+            return None
+        out = year + month + day if day else year + "-" + month if month else year
+    elif month:
+        out = "--" + month + (day or "")
+    elif day:
+        out = "---" + day
+    else:
+        return None
+    if not sep:
+        return out
+    if day is None:
+        # A date-time needs a full date, --MMDD or ---DD
+        return None
+    t = _TIME_RE.fullmatch(time)
+    if t is None:
+        return None
+    return out + "T" + t[1] + t[2] + (t[3] or "") + (t[4] or "").replace(":", "")
+
+def _h_bday(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    if c["bday"] is not None:
+        return
+    value = _unescape(value).strip()
+    c["bday"] = (_bday_40(value) or value) or None
+
+def _h_note(c: dict, params: dict, singleton: list[str], value: str) -> None:
+    c["notes"].append(_unescape(value))
+
+_DISPATCH = {
+    "FN": _h_fn,
+    "N": _h_n,
+    "EMAIL": _h_email,
+    "TEL": _h_tel,
+    "ORG": _h_org,
+    "BDAY": _h_bday,
+    "NOTE": _h_note,
+}
+
+def iter_vcards(text: str | Iterable[str]) -> Iterator[Contact]:
+    """Yield one normalized Contact per BEGIN:VCARD ... END:VCARD block.
+
+    ``text`` is either the whole document or an iterable of lines (e.g. a
+    text file object); line terminators are stripped either way.
+    Properties of nested components (e.g. a 2.1 AGENT card) and lines
+    outside of any card are ignored.
+    """
+    if isinstance(text, str):
+        # Unlike str.splitlines, this breaks only on CR, LF and CRLF
+        text = io.StringIO(text, newline="")
+    lines = (line.rstrip("\r\n") for line in text)
+    first = next(lines, None)
+    if first is None:
+        return
+    # Drop a leading UTF-8 byte order mark
+    lines = chain((first.removeprefix("\ufeff"),), lines)
+    c: dict | None = None
+    depth = 0
+    for line in _unfold(lines):
+        split = _split_line(line)
+        if split is None:
+            continue
+        (head, *raw_params), value = split
+        if any(_has_surrogates(p) for p in raw_params):
+            # Parameters only feed TYPE/CHARSET/ENCODING; drop non-UTF-8 bytes
+            raw_params = [_drop_undecodable(p) for p in raw_params]
+        # Drop an optional group prefix such as "item1.EMAIL"
+        head = head.rpartition(".")[2].strip().upper()
+        if head == "BEGIN":
+            if value.strip().upper() == "VCARD":
+                depth += 1
+                if depth == 1:
+                    c = {
+                        "name": None,
+                        "n": None,
+                        "emails": [],
+                        "phones": [],
+                        "org": None,
+                        "bday": None,
+                        "notes": [],
+                    }
+            continue
+        if head == "END":
+            if value.strip().upper() == "VCARD" and depth:
+                depth -= 1
+                if depth == 0 and c is not None:
+                    if c["n"] is None and c["name"]:
+                        # Derive a minimal N from FN as best-effort using split helper
+                        c["n"] = _split_name(c["name"])
+                    yield Contact(
+                        name=c["name"],
+                        n=c["n"],
+                        emails=tuple(c["emails"]),
+                        phones=tuple(c["phones"]),
+                        org=c["org"],
+                        bday=c["bday"],
+                        notes=tuple(c["notes"]),
+                    )
+                    c = None
+            continue
+        if depth != 1 or c is None:
+            continue
+        handler = _DISPATCH.get(head)
+        if handler is None:
+            continue
+        params, singleton = _parse_params(raw_params) if raw_params else ({}, [])
+        if any(e.upper() == "QUOTED-PRINTABLE" for e in params.get("ENCODING", ())):
+            value = _decode_qp(value, params)
+        elif _has_surrogates(value):
+            value = _decode_8bit(value, params)
+        handler(c, params, singleton, value)
+
+def parse_vcards(text: str | Iterable[str]) -> list[Contact]:
+    """Parse vCard text (or an iterable of its lines) into normalized contacts.
+
+    Text decoded with ``errors="surrogateescape"`` keeps non-UTF-8 bytes,
+    which are then decoded per property using its CHARSET parameter.
+
+    ``n`` is derived from FN when the card has no N property; email and
+    phone types are lowercased, deduplicated and sorted.
+    """
+    return list(iter_vcards(text))
+
+
+# Fixed lines around every card, concatenated once at import time
+_CARD_HEAD = "BEGIN:VCARD" + CRLF + "VERSION:4.0" + CRLF
+_CARD_TAIL_UID = "PRODID:-//BetterVCardTools//v1.0//EN" + CRLF + "UID:"
+_CARD_TAIL_END = CRLF + "END:VCARD" + CRLF
+
+def _uuid4_urns(n: int) -> list[str]:
+    """Return ``n`` random UUIDv4 URNs drawn from a single os.urandom call."""
+    buf = bytearray(os.urandom(16 * n))
+    urns = []
+    for i in range(0, 16 * n, 16):
+        buf[i + 6] = (buf[i + 6] & 0x0F) | 0x40  # version 4
+        buf[i + 8] = (buf[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+        h = buf[i:i + 16].hex()
+        urns.append(
+            "urn:uuid:" + h[:8] + "-" + h[8:12] + "-" + h[12:16] + "-" + h[16:20] + "-" + h[20:]
+        )
+    return urns
+
+def _append_vcard(out: list[str], c: Contact, uid: str) -> None:
+    """Append one vCard 4.0 to ``out`` as CRLF-terminated line fragments."""
+    _esc = _escape
+    _tp = _type_param
+    _nturi = _normalize_tel_uri
+    _app = out.append
+    _app(_CARD_HEAD)
     # FN
-    name = c.get("name") or "Unnamed"
+    name = c.name or "Unnamed"
     # N (structured): family;given;additional;prefix;suffix
-    n_struct = c.get("n") or {
-        "family": "",
-        "given": name,
-        "additional": "",
-        "prefix": "",
-        "suffix": "",
-    }
-    n_fields = [
-        _escape(n_struct.get("family", "")),
-        _escape(n_struct.get("given", "")),
-        _escape(n_struct.get("additional", "")),
-        _escape(n_struct.get("prefix", "")),
-        _escape(n_struct.get("suffix", "")),
-    ]
-    props.append("N:" + ";".join(n_fields))
-    props.append(f"FN:{_escape(name)}")
+    n_struct = c.n
+    if n_struct:
+        _app(
+            "N:"
+            + _esc(n_struct.family)
+            + ";"
+            + _esc(n_struct.given)
+            + ";"
+            + _esc(n_struct.additional)
+            + ";"
+            + _esc(n_struct.prefix)
+            + ";"
+            + _esc(n_struct.suffix)
+            + CRLF
+        )
+    else:
+        _app("N:;" + _esc(name) + ";;;" + CRLF)
+    _app("FN:" + _esc(name) + CRLF)
 
     # EMAIL
-    for e in c.get("emails", []):
-        types = _normalize_types("email", e.get("types", []))
-        type_param = f";TYPE={','.join(types)}" if types else ""
-        props.append(f"EMAIL{type_param}:{_escape(e.get('value',''))}")
+    for e in c.emails:
+        _app("EMAIL" + _tp("email", e.types) + ":" + _esc(e.value) + CRLF)
 
     # TEL (VALUE=uri tel:...)
-    for p in c.get("phones", []):
-        tel_raw = str(p.get("value", ""))
-        # Remove whitespace and common punctuation, keep leading '+' if present
-        tel = re.sub(r"[\s()\-.]", "", tel_raw)
-        if not tel.startswith("tel:"):
-            tel = f"tel:{tel}"
-        types = _normalize_types("tel", p.get("types", []))
-        type_param = f";TYPE={','.join(types)}" if types else ""
-        props.append(f"TEL{type_param};VALUE=uri:{_escape(tel)}")
+    for p in c.phones:
+        _app("TEL" + _tp("tel", p.types) + ";VALUE=uri:" + _esc(_nturi(p.value)) + CRLF)
 
     # ORG structured
-    if c.get("org"):
-        comps = [
-            _escape(str(comp)) for comp in (c.get("org") or [])
-        ]
-        props.append("ORG:" + ";".join(comps))
-
-    # PRODID and UID
-    props.append("PRODID:-//BetterVCardTools//v1.0//EN")
-    # UID (RFC 6350 recommends a URI; use UUID URN)
-    props.append(f"UID:urn:uuid:{uuid4()}")
-    props.append("END:VCARD")
-    return CRLF.join(props) + CRLF
-
-
-def contacts_to_vcards40(contacts: list[dict]) -> str:
-    return "".join(contact_to_vcard40(c) for c in contacts)
+    org = c.org
+    if org:
+        _app("ORG:" + ";".join([_esc(comp) for comp in org]) + CRLF)
+
+    if c.bday:
+        bday = _bday_40(c.bday)
+        if bday:
+            _app("BDAY:" + bday + CRLF)
+        else:
+            _app("BDAY;VALUE=text:" + _esc(c.bday) + CRLF)
+    for note in c.notes:
+        _app("NOTE:" + _esc(note) + CRLF)
+
+    # PRODID, then UID (RFC 6350 recommends a URI; use UUID URN)
+    _app(_CARD_TAIL_UID)
+    _app(uid)
+    _app(_CARD_TAIL_END)
+
+
+def contact_to_vcard40(c: Contact, uid: str | None = None) -> str:
+    out: list[str] = []
+    _append_vcard(out, c, uid or "urn:uuid:" + str(uuid4()))
+    return "".join(out)
+
+
+def _iter_uuid4_urns(batch: int = 256) -> Iterator[str]:
+    """Endless UUIDv4 URNs, drawing randomness for ``batch`` of them at a time."""
+    while True:
+        yield from _uuid4_urns(batch)
+
+def iter_vcards40(contacts: Iterable[Contact]) -> Iterator[str]:
+    """Yield one serialized vCard 4.0 per contact, for callers that stream output."""
+    for c, uid in zip(contacts, _iter_uuid4_urns(), strict=False):
+        yield contact_to_vcard40(c, uid)
+
+
+# Parallel batches at least this large are serialized across worker processes
+_PARALLEL_THRESHOLD = 1000
+_POOL: ProcessPoolExecutor | None = None
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    if _POOL is None:
+        _POOL = ProcessPoolExecutor()
+    return _POOL
+
+def _batches(contacts: Iterable[Contact], size: int) -> Iterator[list[Contact]]:
+    it = iter(contacts)
+    while batch := list(islice(it, size)):
+        yield batch
+
+def _append_batch(out: list[str], batch: list[Contact]) -> None:
+    for c, uid in zip(batch, _uuid4_urns(len(batch)), strict=True):
+        _append_vcard(out, c, uid)
+
+def _serialize_chunk(batch: list[Contact]) -> str:
+    out: list[str] = []
+    _append_batch(out, batch)
+    return "".join(out)
+
+def contacts_to_vcards40(
+    contacts: Iterable[Contact], chunk: int = 500, parallel: bool = False
+) -> str:
+    """Serialize contacts into one vCard 4.0 document.
+
+    With ``parallel=True``, batches of at least ``_PARALLEL_THRESHOLD``
+    contacts are split into ``chunk``-sized pieces and serialized on a
+    process pool; output order is preserved either way.
+    """
+    if not parallel:
+        # All cards share one fragment list that is joined once
+        out: list[str] = []
+        for batch in _batches(contacts, chunk):
+            _append_batch(out, batch)
+        return "".join(out)
+    # Peek at most _PARALLEL_THRESHOLD contacts to pick a path, so plain
+    # iterators such as iter_vcards(text) work without len()
+    it = iter(contacts)
+    head = list(islice(it, _PARALLEL_THRESHOLD))
+    if len(head) < _PARALLEL_THRESHOLD:
+        return _serialize_chunk(head)
+    return "".join(_get_pool().map(_serialize_chunk, _batches(chain(head, it), chunk)))
@@ -1,6 +1,6 @@
 import re
 
-from app.vcards import contacts_to_vcards40, parse_vcards
+from app.vcards import contacts_to_vcards40, iter_vcards, iter_vcards40, parse_vcards
 
 VCARD_21_CHARSET = (
     "BEGIN:VCARD\r\n"
@@ -42,10 +42,11 @@ def test_v21_charset_and_multiple_fields():
     contacts = parse_vcards(VCARD_21_CHARSET)
     assert len(contacts) == 1
     c = contacts[0]
-    # N + FN parsed (best-effort depends on vobject decoding)
-    assert c["emails"][0]["value"].startswith("john@")
-    assert len(c["emails"]) == 2
-    assert len(c["phones"]) == 2
+    assert c.name == "Jöhn Dör"
+    assert (c.n.family, c.n.given) == ("Dör", "Jöhn")
+    assert c.emails[0].value.startswith("john@")
+    assert len(c.emails) == 2
+    assert len(c.phones) == 2
     out = contacts_to_vcards40(contacts)
     # TEL formatting normalized (no spaces/paren/dashes) and VALUE=uri
     # Allow optional carriage return before newline in CRLF outputs
@@ -71,3 +72,38 @@ def test_multiple_contacts_roundtrip():
     # Two cards begin and end
     assert out.count("BEGIN:VCARD") == 2
     assert out.count("END:VCARD") == 2
+
+
+def test_large_batch_serializes_every_contact_in_order():
+    contacts = parse_vcards(VCARD_MULTI) * 600
+    out = contacts_to_vcards40(contacts, parallel=True)
+    assert out.count("BEGIN:VCARD") == 1200
+    names = re.findall(r"^FN:(.*?)\r?$", out, re.M)
+    assert names == ["Ada Alpha", "Bob Beta"] * 600
+    # Every card still gets its own UID
+    assert len(set(re.findall(r"^UID:(.*?)\r?$", out, re.M))) == 1200
+
+
+def test_serialize_from_contact_iterator():
+    out = contacts_to_vcards40(iter_vcards(VCARD_MULTI))
+    assert out.count("BEGIN:VCARD") == 2
+    assert re.search(r"^FN:Bob Beta\r?$", out, re.M)
+
+
+def test_v21_raw_8bit_charset_is_decoded():
+    raw = VCARD_21_CHARSET.encode("iso-8859-1")
+    contacts = parse_vcards(raw.decode("utf-8", errors="surrogateescape"))
+    assert contacts[0].name == "Jöhn Dör"
+    assert contacts[0].org == ("Åcme", "Sälës")
+
+
+def test_streamed_cards_get_distinct_uids():
+    cards = list(iter_vcards40(parse_vcards(VCARD_MULTI) * 300))
+    assert len(cards) == 600
+    uids = {re.search(r"^UID:(.*?)\r?$", card, re.M).group(1) for card in cards}
+    assert len(uids) == 600
+
+
+def test_parsed_contacts_are_hashable():
+    contacts = parse_vcards(VCARD_MULTI)
+    assert len(set(contacts)) == 2
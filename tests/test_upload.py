@@ -0,0 +1,37 @@
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_upload_non_utf8_bytes_in_parameter():
+    data = (
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "FN;CHARSET=ISO-8859-1:Jöhn Dör\r\n"
+        "TEL;HÖME:123\r\n"
+        "END:VCARD\r\n"
+    ).encode("iso-8859-1")
+    r = client.post("/upload", files={"file": ("old.vcf", data, "text/vcard")})
+    assert r.status_code == 200
+    assert "FN:Jöhn Dör\r\n" in r.text
+    # Undecodable parameter bytes are dropped, as the baseline decode did
+    assert "TEL;TYPE=hme;VALUE=uri:tel:123\r\n" in r.text
+
+
+def test_upload_unusual_charsets_do_not_break_response():
+    data = (
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "FN;CHARSET=utf-7;ENCODING=QUOTED-PRINTABLE:A+2AA-B\r\n"
+        "NOTE;CHARSET=unicode_escape;ENCODING=QUOTED-PRINTABLE:x\\ud800y\r\n"
+        "NOTE;CHARSET=idna;ENCODING=QUOTED-PRINTABLE:=FF=FE.example\r\n"
+        "ORG;CHARSET=punycode:Acme\xff\r\n"
+        "END:VCARD\r\n"
+    ).encode("iso-8859-1")
+    r = client.post("/upload", files={"file": ("odd.vcf", data, "text/vcard")})
+    assert r.status_code == 200
+    assert "FN:AB\r\n" in r.text
+    assert "NOTE:xy\r\n" in r.text
+    assert r.text.endswith("END:VCARD\r\n")
@@ -1,5 +1,8 @@
+import io
 import re
+import uuid
 
+from app.models import Email
 from app.vcards import contacts_to_vcards40, parse_vcards
 
 SAMPLE = (
@@ -17,9 +20,9 @@ def test_parse_and_serialize_types_and_org():
     contacts = parse_vcards(SAMPLE)
     assert len(contacts) == 1
     c = contacts[0]
-    assert c["n"]["family"] == "Doe"
-    assert c["n"]["given"] == "John"
-    assert c["org"] == ["Acme", "Sales"]
+    assert c.n.family == "Doe"
+    assert c.n.given == "John"
+    assert c.org == ("Acme", "Sales")
     # Serialize
     out = contacts_to_vcards40(contacts)
     assert "VERSION:4.0" in out
@@ -29,3 +32,169 @@ def test_parse_and_serialize_types_and_org():
     assert re.search(r"^EMAIL;TYPE=work:john.doe@example.com\r?$", out, re.M)
     # UID present as UUID URN (allow CRLF)
     assert re.search(r"^UID:urn:uuid:[0-9a-fA-F-]{36}\r?$", out, re.M)
+
+
+FOLDED = (
+    "BEGIN:VCARD\r\n"
+    "VERSION:3.0\r\n"
+    "FN:Jane\r\n"
+    "  Roe\r\n"
+    "N:Roe;Jane;;;\r\n"
+    "item1.EMAIL;type=INTERNET;type=HOME:jane@example.com\r\n"
+    "ORG:Acme\\, Inc;R&D\r\n"
+    "END:VCARD\r\n"
+)
+
+def test_parse_folded_lines_groups_and_escapes():
+    contacts = parse_vcards(FOLDED)
+    assert len(contacts) == 1
+    c = contacts[0]
+    assert c.name == "Jane Roe"
+    assert c.emails == (Email("jane@example.com", ("home",)),)
+    assert c.org == ("Acme, Inc", "R&D")
+
+
+def test_serialize_escapes_text_values():
+    out = contacts_to_vcards40(parse_vcards(FOLDED))
+    # RFC 6350: a single backslash before each special character
+    assert re.search(r"^ORG:Acme\\, Inc;R&D\r?$", out, re.M)
+
+
+def test_batch_uids_are_distinct_uuid4_urns():
+    out = contacts_to_vcards40(parse_vcards(SAMPLE) * 3)
+    uids = re.findall(r"^UID:urn:uuid:(.*?)\r?$", out, re.M)
+    assert len(set(uids)) == 3
+    assert all(uuid.UUID(u).version == 4 for u in uids)
+
+
+BDAY_NOTES = (
+    "BEGIN:VCARD\r\n"
+    "VERSION:3.0\r\n"
+    "FN:Ann Lee\r\n"
+    "BDAY:1990-04-15\r\n"
+    "NOTE:Met at the conference\\, row 3\\nCall back\r\n"
+    "NOTE:Second note\r\n"
+    "END:VCARD\r\n"
+)
+
+def test_bday_and_notes_roundtrip():
+    contacts = parse_vcards(BDAY_NOTES)
+    c = contacts[0]
+    assert c.bday == "19900415"
+    assert c.notes == ("Met at the conference, row 3\nCall back", "Second note")
+    out = contacts_to_vcards40(contacts)
+    assert re.search(r"^BDAY:19900415\r?$", out, re.M)
+    assert re.search(r"^NOTE:Met at the conference\\, row 3\\nCall back\r?$", out, re.M)
+    assert len(re.findall(r"^NOTE:", out, re.M)) == 2
+
+
+def test_quoted_parameter_values_may_contain_separators():
+    contacts = parse_vcards(
+        "BEGIN:VCARD\r\n"
+        "VERSION:3.0\r\n"
+        'EMAIL;X-LABEL="a:b;c";TYPE=HOME:x@y.example\r\n'
+        "END:VCARD\r\n"
+    )
+    assert contacts[0].emails == (Email("x@y.example", ("home",)),)
+
+
+def test_string_and_line_iterator_inputs_agree():
+    text = (
+        "BEGIN:VCARD\r\n"
+        "VERSION:3.0\r\n"
+        "FN:A\x1cB\r\n"
+        "NOTE:first\u2028second\x0bthird\r\n"
+        "END:VCARD\r\n"
+    )
+    from_str = parse_vcards(text)
+    assert from_str == parse_vcards(io.StringIO(text, newline=""))
+    assert from_str[0].name == "A\x1cB"
+    assert from_str[0].notes == ("first\u2028second\x0bthird",)
+
+
+def test_bday_date_time_converted_to_basic_form():
+    contacts = parse_vcards(
+        "BEGIN:VCARD\r\nVERSION:3.0\r\nFN:A\r\nBDAY:1990-04-15T08:30:00Z\r\nEND:VCARD\r\n"
+    )
+    out = contacts_to_vcards40(contacts)
+    assert re.search(r"^BDAY:19900415T083000Z\r?$", out, re.M)
+
+
+def test_non_date_bday_is_escaped_text():
+    contacts = parse_vcards(
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "FN:A\r\n"
+        "BDAY;ENCODING=QUOTED-PRINTABLE:circa 1800, maybe=0D=0AX-EVIL:1\r\n"
+        "END:VCARD\r\n"
+    )
+    out = contacts_to_vcards40(contacts)
+    assert re.search(r"^BDAY;VALUE=text:circa 1800\\, maybe\\nX-EVIL:1\r?$", out, re.M)
+    assert not re.search(r"^X-EVIL", out, re.M)
+
+
+def test_qp_soft_line_breaks_are_joined():
+    contacts = parse_vcards(
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "NOTE;ENCODING=QUOTED-PRINTABLE;CHARSET=UTF-8:Caf=C3=A9 a=\r\n"
+        "u lait=\r\n"
+        "=20noir\r\n"
+        "END:VCARD\r\n"
+    )
+    assert contacts[0].notes == ("Café au lait noir",)
+
+
+def test_qp_trailing_soft_break_does_not_swallow_end():
+    contacts = parse_vcards(
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "FN:A\r\n"
+        "NOTE;ENCODING=QUOTED-PRINTABLE:abc=\r\n"
+        "END:VCARD\r\n"
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "FN:B\r\n"
+        "END:VCARD\r\n"
+    )
+    assert [c.name for c in contacts] == ["A", "B"]
+    assert contacts[0].notes == ("abc",)
+
+
+def test_bare_qp_flag_is_not_a_type():
+    contacts = parse_vcards(
+        "BEGIN:VCARD\r\n"
+        "VERSION:2.1\r\n"
+        "TEL;CELL;QUOTED-PRINTABLE:555=2D0100\r\n"
+        "EMAIL;INTERNET;QUOTED-PRINTABLE:a=40b.example\r\n"
+        "END:VCARD\r\n"
+    )
+    c = contacts[0]
+    assert c.phones[0].types == ("cell",)
+    assert c.emails[0] == Email("a@b.example", ())
+    out = contacts_to_vcards40(contacts)
+    assert re.search(r"^TEL;TYPE=cell;VALUE=uri:tel:5550100\r?$", out, re.M)
+    assert re.search(r"^EMAIL:a@b.example\r?$", out, re.M)
+
+
+def test_leading_bom_and_escaped_tel():
+    contacts = parse_vcards(
+        "\ufeffBEGIN:VCARD\r\n"
+        "VERSION:3.0\r\n"
+        "FN:A\r\n"
+        "TEL:555\\,1\r\n"
+        "END:VCARD\r\n"
+    )
+    assert [c.name for c in contacts] == ["A"]
+    assert contacts[0].phones[0].value == "555,1"
+
+
+def test_reduced_precision_bday_kept_as_date():
+    cards = "".join(
+        "BEGIN:VCARD\r\nVERSION:4.0\r\nFN:A\r\nBDAY:" + b + "\r\nEND:VCARD\r\n"
+        for b in ("1985", "1985-04", "--0415", "---15", "--04-15")
+    )
+    out = contacts_to_vcards40(parse_vcards(cards))
+    assert re.findall(r"^BDAY:(.*?)\r?$", out, re.M) == [
+        "1985", "1985-04", "--0415", "---15", "--0415"
+    ]